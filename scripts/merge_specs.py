@@ -7,11 +7,17 @@ Fully automated - no manual intervention required.
 
 import argparse
 import json
+import os
+import re
 import sys
-from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml
 from rich.console import Console
@@ -31,8 +37,36 @@ from scripts.utils.domain_metadata import (
 )
 from scripts.utils.server_variables import ServerVariableHelper
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 console = Console()
 
+# orjson parses integers beyond 64 bits as floats, so input containing a long
+# digit run is parsed by the standard library to keep such values exact
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
+
+# A float value in orjson's indented output: alone after its key or on its own
+# line (strings cannot span lines), and always containing a "." or an exponent
+_FLOAT_VALUE = re.compile(rb'(?:^ *|": )(-?\d+(?:\.\d+)?e-?\d+|-?\d+\.\d+),?$', re.MULTILINE)
+
+# Number of threads used to write merged domain specs to disk
+SAVE_WORKERS = 4
+
+# Number of threads used to read a domain's spec files; file reads release the
+# GIL, so they overlap with parsing the files already read
+READ_WORKERS = 8
+
 # Default critical resources list (fallback if config not found)
 DEFAULT_CRITICAL_RESOURCES = [
     "http_loadbalancer",
@@ -53,6 +87,20 @@ DEFAULT_CRITICAL_RESOURCES = [
 ]
 
 
+# Component sections merged across specs, in MergeStats field order
+# (requestBodies is critical for Scalar/Swagger UI compatibility)
+COMPONENT_SECTIONS = ("schemas", "responses", "parameters", "requestBodies")
+
+
+class MergeStats(NamedTuple):
+    """Number of components added to each section by merge_components."""
+
+    schemas: int
+    responses: int
+    parameters: int
+    request_bodies: int
+
+
 def load_critical_resources() -> list[str]:
     """Load critical resources list from configuration.
 
@@ -61,40 +109,109 @@ def load_critical_resources() -> list[str]:
     """
     config_path = Path(__file__).parent.parent / "config" / "critical_resources.yaml"
 
-    if not config_path.exists():
-        return DEFAULT_CRITICAL_RESOURCES
-
     try:
-        with config_path.open() as f:
-            config = yaml.safe_load(f) or {}
+        config = yaml.load(config_path.read_bytes(), Loader=YamlSafeLoader) or {}
         return config.get("resources", DEFAULT_CRITICAL_RESOURCES)
+    except FileNotFoundError:
+        return DEFAULT_CRITICAL_RESOURCES
     except Exception as e:
         console.print(f"[yellow]Warning: Failed to load critical resources config: {e}[/yellow]")
         return DEFAULT_CRITICAL_RESOURCES
 
 
+class _NonFiniteFloat(float):
+    """NaN or Infinity parsed from a spec.
+
+    orjson writes non-finite floats as null but rejects float subclasses, so
+    specs holding these values are written by the standard library unchanged.
+    """
+
+
+def _floats_match_stdlib(data: bytes) -> bool:
+    """Return whether every float in orjson output is formatted like json.dumps.
+
+    orjson writes some floats differently (1.5e-7 for 1.5e-07, 0.00001 for
+    1e-05) while the standard library always uses float.__repr__.
+    """
+    for match in _FLOAT_VALUE.finditer(data):
+        token = match.group(1).decode()
+        if repr(float(token)) != token:
+            return False
+    return True
+
+
 def load_spec(spec_path: Path) -> dict[str, Any]:
-    """Load an OpenAPI specification from JSON file."""
-    with spec_path.open() as f:
-        return json.load(f)
+    """Load an OpenAPI specification from JSON file.
+
+    Reads the whole file as bytes in one call and parses it with orjson when
+    available, falling back to the standard library (which decodes UTF-8
+    bytes itself, independent of the locale encoding). Files that may hold
+    integers beyond 64 bits, and files orjson rejects (NaN/Infinity literals,
+    lone surrogate escapes), are parsed by the standard library.
+    """
+    data = spec_path.read_bytes()
+    if ORJSON_AVAILABLE and not _LONG_DIGIT_RUN.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data, parse_constant=_NonFiniteFloat)
 
 
 def save_spec(spec: dict[str, Any], output_path: Path, indent: int = 2) -> None:
-    """Save an OpenAPI specification to JSON file."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w") as f:
-        json.dump(spec, f, indent=indent, ensure_ascii=False)
-        f.write("\n")
+    """Save an OpenAPI specification to JSON file.
+
+    Uses orjson for the default 2-space indent when available, falling back
+    to the standard library otherwise. Specs orjson cannot write exactly as
+    the standard library does (floats formatted differently, integers beyond
+    64 bits, NaN/Infinity, lone surrogates) are written by the standard
+    library, so output is the same either way. Non-ASCII text is written as
+    UTF-8. An existing file with identical content is left untouched so its
+    mtime does not invalidate downstream caches.
+    """
+    data = None
+    if ORJSON_AVAILABLE and indent == 2:
+        try:
+            data = orjson.dumps(spec, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # value orjson cannot serialize exactly
+        else:
+            if not _floats_match_stdlib(data):
+                data = None
+    if data is None:
+        data = (json.dumps(spec, indent=indent, ensure_ascii=False) + "\n").encode()
 
+    try:
+        # Cheap size check first; only same-sized files are read back and compared
+        if output_path.stat().st_size == len(data) and output_path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(data)
 
+
+@lru_cache(maxsize=4096)
 def categorize_spec(filename: str) -> str:
     """Categorize a specification file by domain based on filename patterns.
 
     Delegates to centralized domain_categorizer utility for pattern matching.
+    Results are memoized since categorization is a pure function of the filename.
     """
     return categorize_spec_util(filename)
 
 
+@lru_cache(maxsize=1)
+def _server_variable_helper() -> ServerVariableHelper:
+    """Return a shared ServerVariableHelper so its YAML config is parsed once per process."""
+    return ServerVariableHelper()
+
+
+@lru_cache(maxsize=1)
+def _description_enricher() -> DescriptionEnricher:
+    """Return a shared DescriptionEnricher so its YAML config is parsed once per process."""
+    return DescriptionEnricher()
+
+
 def create_base_spec(
     title: str,
     description: str,
@@ -111,58 +228,50 @@ def create_base_spec(
 
     Delegates to ServerVariableHelper for centralized server variable management.
     """
-    helper = ServerVariableHelper()
-    return helper.create_base_spec(title, description, version, upstream_info)
+    return _server_variable_helper().create_base_spec(title, description, version, upstream_info)
+
+
+def _merge_component_map(
+    target_map: dict[str, Any],
+    source_map: dict[str, Any],
+    prefix: str = "",
+) -> int:
+    """Copy entries missing from target_map out of source_map.
+
+    Returns the number of entries added. A prefix is applied to the whole
+    source map up front so both cases share one path. When no name collides
+    (checked with a keys-view isdisjoint, which walks the smaller side in C)
+    source_map is inserted as-is; otherwise the new entries are collected in
+    one comprehension. Either way source order is kept and existing entries win.
+    """
+    if prefix:
+        source_map = {f"{prefix}{name}": value for name, value in source_map.items()}
+
+    if target_map.keys().isdisjoint(source_map.keys()):
+        new_entries = source_map
+    else:
+        new_entries = {name: value for name, value in source_map.items() if name not in target_map}
+    target_map.update(new_entries)
+    return len(new_entries)
 
 
 def merge_components(
     target: dict[str, Any],
     source: dict[str, Any],
     prefix: str = "",
-) -> dict[str, int]:
+) -> MergeStats:
     """Merge components from source into target with conflict resolution."""
-    stats = {"schemas": 0, "responses": 0, "parameters": 0, "requestBodies": 0}
-
     source_components = source.get("components", {})
     target_components = target.setdefault("components", {})
 
-    # Merge schemas
-    source_schemas = source_components.get("schemas", {})
-    target_schemas = target_components.setdefault("schemas", {})
-    for name, schema in source_schemas.items():
-        prefixed_name = f"{prefix}{name}" if prefix else name
-        if prefixed_name not in target_schemas:
-            target_schemas[prefixed_name] = schema
-            stats["schemas"] += 1
-
-    # Merge responses
-    source_responses = source_components.get("responses", {})
-    target_responses = target_components.setdefault("responses", {})
-    for name, response in source_responses.items():
-        prefixed_name = f"{prefix}{name}" if prefix else name
-        if prefixed_name not in target_responses:
-            target_responses[prefixed_name] = response
-            stats["responses"] += 1
-
-    # Merge parameters
-    source_params = source_components.get("parameters", {})
-    target_params = target_components.setdefault("parameters", {})
-    for name, param in source_params.items():
-        prefixed_name = f"{prefix}{name}" if prefix else name
-        if prefixed_name not in target_params:
-            target_params[prefixed_name] = param
-            stats["parameters"] += 1
-
-    # Merge requestBodies (critical for Scalar/Swagger UI compatibility)
-    source_request_bodies = source_components.get("requestBodies", {})
-    target_request_bodies = target_components.setdefault("requestBodies", {})
-    for name, request_body in source_request_bodies.items():
-        prefixed_name = f"{prefix}{name}" if prefix else name
-        if prefixed_name not in target_request_bodies:
-            target_request_bodies[prefixed_name] = request_body
-            stats["requestBodies"] += 1
-
-    return stats
+    return MergeStats._make(
+        _merge_component_map(
+            target_components.setdefault(section, {}),
+            source_components.get(section, {}),
+            prefix,
+        )
+        for section in COMPONENT_SECTIONS
+    )
 
 
 def merge_paths(target: dict[str, Any], source: dict[str, Any], domain: str = "") -> int:
@@ -174,12 +283,13 @@ def merge_paths(target: dict[str, Any], source: dict[str, Any], domain: str = ""
     source_paths = source.get("paths", {})
     target_paths = target.setdefault("paths", {})
 
-    paths_added = 0
     is_cdn_domain = domain == "cdn_and_content_delivery"
     is_data_intelligence_domain = domain == "data_intelligence"
     is_user_mgmt_domain = domain == "user_and_account_management"
     is_threat_campaign_domain = domain == "threat_campaign"
 
+    # Paths that pass the domain filters, in source order
+    kept_paths: dict[str, Any] = {}
     for path, path_item in source_paths.items():
         # Skip CDN paths if not merging into CDN domain
         if not is_cdn_domain and ("/api/cdn/" in path or "/cdn_loadbalancers/" in path):
@@ -203,15 +313,25 @@ def merge_paths(target: dict[str, Any], source: dict[str, Any], domain: str = ""
         if not is_user_mgmt_domain and is_credential_path:
             continue
 
-        if path not in target_paths:
+        kept_paths[path] = path_item
+
+    # Common case (always for the first spec of a domain): every path is new
+    if target_paths.keys().isdisjoint(kept_paths.keys()):
+        target_paths.update(kept_paths)
+        return len(kept_paths)
+
+    paths_added = 0
+    for path, path_item in kept_paths.items():
+        existing = target_paths.get(path)
+        if existing is None:
             target_paths[path] = path_item
             paths_added += 1
         else:
-            # Merge methods if path already exists
+            # Merge methods if path already exists; existing methods win
+            before = len(existing)
             for method, operation in path_item.items():
-                if method not in target_paths[path]:
-                    target_paths[path][method] = operation
-                    paths_added += 1
+                existing.setdefault(method, operation)
+            paths_added += len(existing) - before
 
     return paths_added
 
@@ -238,50 +358,169 @@ def add_domain_metadata_to_spec(spec: dict[str, Any], domain: str) -> None:
 
 def extract_tags(spec: dict[str, Any]) -> list[dict[str, str]]:
     """Extract unique tags from a specification."""
-    tags = []
-    seen_names = set()
+    # Name -> tag; insertion order gives first-seen ordering without a separate set
+    tags: dict[str, dict[str, str]] = {}
 
     # Get explicit tags
     for tag in spec.get("tags", []):
-        if tag.get("name") and tag["name"] not in seen_names:
-            tags.append(tag)
-            seen_names.add(tag["name"])
+        name = tag.get("name")
+        if name:
+            tags.setdefault(name, tag)
 
     # Extract tags from paths
     for path_item in spec.get("paths", {}).values():
         for operation in path_item.values():
             if isinstance(operation, dict):
                 for tag_name in operation.get("tags", []):
-                    if tag_name not in seen_names:
-                        tags.append({"name": tag_name})
-                        seen_names.add(tag_name)
+                    if tag_name not in tags:
+                        tags[tag_name] = {"name": tag_name}
+
+    return list(tags.values())
+
+
+def _dedupe_tags(tags: Iterable[dict[str, str]]) -> list[dict[str, str]]:
+    """Keep the first tag object for each name, sorted by name.
+
+    Tags without a name are dropped.
+    """
+    unique: dict[str, dict[str, str]] = {}
+    for tag in tags:
+        name = tag.get("name")
+        if name:
+            unique.setdefault(name, tag)
+    return sorted(unique.values(), key=itemgetter("name"))
+
 
-    return tags
+def _load_spec_file(spec_file: Path) -> tuple[dict[str, Any] | None, str]:
+    """Load and sanity-check a single spec file ahead of merging.
 
+    Failures are reported through a sentinel return value rather than an
+    exception, so files can be loaded on a thread pool and reported in order.
+
+    Args:
+        spec_file: Path to the specification file to load
 
-def _process_single_spec_file(
-    spec_file: Path,
+    Returns:
+        Tuple of (spec, error_message). spec is None when loading failed.
+    """
+    try:
+        spec = load_spec(spec_file)
+    except (OSError, ValueError) as e:
+        return None, str(e)
+
+    if not isinstance(spec, dict):
+        return None, "specification root is not a JSON object"
+    paths = spec.get("paths", {})
+    components = spec.get("components", {})
+    if not isinstance(paths, dict) or not isinstance(components, dict):
+        return None, "paths and components must be JSON objects"
+    # Reject shapes the merge would otherwise copy into the domain spec half-way
+    for section in COMPONENT_SECTIONS:
+        if not isinstance(components.get(section, {}), dict):
+            return None, f"components.{section} must be a JSON object"
+    if not all(isinstance(item, dict) for item in paths.values()):
+        return None, "every path item must be a JSON object"
+    tags = spec.get("tags", [])
+    if not isinstance(tags, list):
+        return None, "tags must be a JSON array"
+    if not all(isinstance(tag, dict) for tag in tags):
+        return None, "every tag must be a JSON object"
+    return spec, ""
+
+
+def _merge_single_spec(
+    spec: dict[str, Any],
     merged: dict[str, Any],
     domain: str = "",
-) -> tuple[bool, int, dict[str, int], list[dict[str, str]], str]:
-    """Process a single spec file for merging.
+) -> tuple[int, MergeStats, list[dict[str, str]]]:
+    """Merge a single pre-loaded spec into the domain specification.
 
     Args:
-        spec_file: Path to the specification file to process
+        spec: Specification loaded by _load_spec_file
         merged: Target merged specification to merge into
         domain: Domain category for filtering (e.g., "cdn_and_content_delivery")
 
     Returns:
-        Tuple of (success, paths_added, comp_stats, tags, error_message).
+        Tuple of (paths_added, comp_stats, tags).
     """
-    try:
-        spec = load_spec(spec_file)
-        paths_added = merge_paths(merged, spec, domain=domain)
-        comp_stats = merge_components(merged, spec)
-        tags = extract_tags(spec)
-        return True, paths_added, comp_stats, tags, ""
-    except Exception as e:
-        return False, 0, {"schemas": 0, "requestBodies": 0}, [], str(e)
+    paths_added = merge_paths(merged, spec, domain=domain)
+    comp_stats = merge_components(merged, spec)
+    tags = extract_tags(spec)
+    return paths_added, comp_stats, tags
+
+
+def _merge_domain(
+    domain: str,
+    domain_files: list[Path],
+    version: str,
+    upstream_info: dict[str, str] | None = None,
+) -> tuple[dict[str, Any], dict[str, int], list[str]]:
+    """Merge all specification files of a single domain.
+
+    Args:
+        domain: Domain name the files were categorized into.
+        domain_files: Spec files belonging to the domain, in merge order.
+        version: Version string for the merged specification.
+        upstream_info: Optional upstream info from get_upstream_info().
+
+    Returns:
+        Tuple of (merged spec, merge counts, warnings for files that failed to load).
+    """
+    domain_title = domain.replace("_", " ").title()
+    merged = create_base_spec(
+        title=f"F5 XC {domain_title} API",
+        description=f"F5 Distributed Cloud {domain_title} API specifications",
+        version=version,
+        upstream_info=upstream_info,
+    )
+
+    # Load every file up front so reads overlap; merging stays in file order
+    if len(domain_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(domain_files))) as read_pool:
+            load_results = list(read_pool.map(_load_spec_file, domain_files))
+    else:
+        load_results = [_load_spec_file(spec_file) for spec_file in domain_files]
+
+    warnings = []
+    stats = {"specs": 0, "paths": 0, "schemas": 0, "requestBodies": 0}
+    all_tags: list[dict[str, str]] = []
+    for spec_file, (spec, error) in zip(domain_files, load_results, strict=True):
+        if spec is None:
+            warnings.append(f"Failed to merge {spec_file.name}: {error}")
+            continue
+
+        try:
+            paths_added, comp_stats, tags = _merge_single_spec(spec, merged, domain=domain)
+        except (AttributeError, TypeError) as e:
+            # Malformed structure below the top level (e.g. a list where an object belongs)
+            warnings.append(f"Failed to merge {spec_file.name}: {e}")
+            continue
+
+        stats["paths"] += paths_added
+        stats["schemas"] += comp_stats.schemas
+        stats["requestBodies"] += comp_stats.request_bodies
+        all_tags.extend(tags)
+        stats["specs"] += 1
+
+    merged["tags"] = _dedupe_tags(all_tags)
+
+    # Add spec-level domain metadata (idempotent)
+    add_domain_metadata_to_spec(merged, domain)
+
+    return merged, stats, warnings
+
+
+def _merge_and_save_domain(
+    domain: str,
+    domain_files: list[Path],
+    version: str,
+    upstream_info: dict[str, str] | None,
+    output_path: Path,
+) -> tuple[dict[str, Any], dict[str, int], list[str]]:
+    """Merge a single domain and write it to disk (worker process entry point)."""
+    result = _merge_domain(domain, domain_files, version, upstream_info)
+    save_spec(result[0], output_path)
+    return result
 
 
 def merge_specs_by_domain(
@@ -289,24 +528,45 @@ def merge_specs_by_domain(
     output_dir: Path,
     version: str,
     upstream_info: dict[str, str] | None = None,
+    parallel: bool = True,
+    workers: int = 4,
 ) -> dict[str, dict[str, Any]]:
-    """Merge specifications grouped by domain."""
-    spec_files = sorted(specs_dir.glob("*.json"))
-    if not spec_files:
+    """Merge specifications grouped by domain.
+
+    Args:
+        specs_dir: Directory containing processed specifications.
+        output_dir: Directory for merged domain specifications.
+        version: Version string for merged specifications.
+        upstream_info: Optional upstream info from get_upstream_info().
+        parallel: Merge domains in separate worker processes.
+        workers: Number of worker processes when parallel.
+
+    Returns:
+        Merged specs keyed by domain, in sorted domain order.
+    """
+    # os.scandir yields DirEntry objects with cached type info, avoiding a Path
+    # allocation and stat() per candidate; sort on the plain name string.
+    with os.scandir(specs_dir) as it:
+        entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    if not entries:
         console.print(f"[yellow]No specification files found in {specs_dir}[/yellow]")
         return {}
 
-    # Group specs by domain
-    domain_specs: dict[str, list[Path]] = defaultdict(list)
-    for spec_file in spec_files:
-        domain = categorize_spec(spec_file.name)
-        domain_specs[domain].append(spec_file)
+    # Group specs by domain: categorize every file once, then a stable sort on the
+    # domain keeps files in name order within each group, and groups in domain order
+    categorized = sorted(
+        ((categorize_spec(entry.name), Path(entry.path)) for entry in entries),
+        key=itemgetter(0),
+    )
+    domain_specs: dict[str, list[Path]] = {
+        domain: [path for _, path in group]
+        for domain, group in groupby(categorized, key=itemgetter(0))
+    }
 
-    console.print(f"[blue]Found {len(spec_files)} specs across {len(domain_specs)} domains[/blue]")
-
-    merged_specs = {}
-    stats = {"domains": 0, "specs": 0, "paths": 0, "schemas": 0, "requestBodies": 0}
+    console.print(f"[blue]Found {len(entries)} specs across {len(domain_specs)} domains[/blue]")
 
+    results: dict[str, tuple[dict[str, Any], dict[str, int], list[str]]] = {}
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -314,55 +574,56 @@ def merge_specs_by_domain(
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeElapsedColumn(),
         console=console,
+        # CI logs gain nothing from a live bar; skip rendering when not on a TTY
+        disable=not console.is_terminal,
     ) as progress:
         task = progress.add_task("Merging specifications...", total=len(domain_specs))
 
-        for domain, domain_files in sorted(domain_specs.items()):
-            domain_title = domain.replace("_", " ").title()
-            merged = create_base_spec(
-                title=f"F5 XC {domain_title} API",
-                description=f"F5 Distributed Cloud {domain_title} API specifications",
-                version=version,
-                upstream_info=upstream_info,
-            )
-
-            all_tags = []
-            for spec_file in domain_files:
-                success, paths_added, comp_stats, tags, error = _process_single_spec_file(
-                    spec_file,
-                    merged,
-                    domain=domain,
-                )
-                if success:
-                    stats["paths"] += paths_added
-                    stats["schemas"] += comp_stats["schemas"]
-                    stats["requestBodies"] += comp_stats["requestBodies"]
-                    all_tags.extend(tags)
-                    stats["specs"] += 1
-                else:
-                    console.print(
-                        f"[yellow]Warning: Failed to merge {spec_file.name}: {error}[/yellow]",
-                    )
-
-            # Deduplicate and sort tags
-            seen_tag_names = set()
-            unique_tags = []
-            for tag in all_tags:
-                if tag.get("name") and tag["name"] not in seen_tag_names:
-                    unique_tags.append(tag)
-                    seen_tag_names.add(tag["name"])
-            merged["tags"] = sorted(unique_tags, key=lambda t: t.get("name", ""))
-
-            # Add spec-level domain metadata (idempotent)
-            add_domain_metadata_to_spec(merged, domain)
-
-            # Save domain-specific merged spec
-            output_path = output_dir / f"{domain}.json"
-            save_spec(merged, output_path)
-            merged_specs[domain] = merged
-            stats["domains"] += 1
-
-            progress.update(task, advance=1)
+        if parallel and workers > 1:
+            # Domains are independent, so each worker merges and writes one domain
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        _merge_and_save_domain,
+                        domain,
+                        domain_files,
+                        version,
+                        upstream_info,
+                        output_dir / f"{domain}.json",
+                    ): domain
+                    for domain, domain_files in domain_specs.items()
+                }
+
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    progress.update(task, advance=1)
+        else:
+            # Domain files are written on a small thread pool so disk writes overlap
+            # with merging the next domain; each merged dict is complete when submitted.
+            save_futures: list[Future[None]] = []
+            with ThreadPoolExecutor(max_workers=SAVE_WORKERS) as save_pool:
+                for domain, domain_files in domain_specs.items():
+                    result = _merge_domain(domain, domain_files, version, upstream_info)
+                    results[domain] = result
+                    output_path = output_dir / f"{domain}.json"
+                    save_futures.append(save_pool.submit(save_spec, result[0], output_path))
+                    progress.update(task, advance=1)
+
+            # Re-raise any write failure from the pool
+            for save_future in save_futures:
+                save_future.result()
+
+    # Collect in sorted domain order so the master spec is independent of completion order
+    merged_specs = {}
+    stats = {"domains": 0, "specs": 0, "paths": 0, "schemas": 0, "requestBodies": 0}
+    for domain in sorted(results):
+        merged, domain_stats, warnings = results[domain]
+        for warning in warnings:
+            console.print(f"[yellow]Warning: {warning}[/yellow]")
+        for key, value in domain_stats.items():
+            stats[key] += value
+        merged_specs[domain] = merged
+        stats["domains"] += 1
 
     # Print stats
     table = Table(title="Merge Statistics")
@@ -386,8 +647,7 @@ def create_master_spec(
 ) -> dict[str, Any]:
     """Create a master specification combining all domains."""
     # Load enriched description for root/master spec
-    enricher = DescriptionEnricher()
-    root_desc = enricher.get_description("root", tier="long")
+    root_desc = _description_enricher().get_description("root", tier="long")
 
     master = create_base_spec(
         title="F5 Distributed Cloud API",
@@ -396,27 +656,20 @@ def create_master_spec(
         upstream_info=upstream_info,
     )
 
-    all_tags = []
+    master_paths = master["paths"]
+    all_tags: list[dict[str, str]] = []
     for spec in merged_specs.values():
-        # Merge paths with domain prefix in tags
-        for path, path_item in spec.get("paths", {}).items():
-            if path not in master["paths"]:
-                master["paths"][path] = path_item
+        # Merge paths (first domain wins); domains rarely share paths, so this is
+        # usually a single dict.update of the whole map
+        _merge_component_map(master_paths, spec.get("paths", {}))
 
         # Merge components
         merge_components(master, spec)
 
-        # Collect tags
+        # Collect tags (first domain wins)
         all_tags.extend(spec.get("tags", []))
 
-    # Deduplicate tags
-    seen_tag_names = set()
-    unique_tags = []
-    for tag in all_tags:
-        if tag.get("name") and tag["name"] not in seen_tag_names:
-            unique_tags.append(tag)
-            seen_tag_names.add(tag["name"])
-    master["tags"] = sorted(unique_tags, key=lambda t: t.get("name", ""))
+    master["tags"] = _dedupe_tags(all_tags)
 
     save_spec(master, output_path)
 
@@ -430,11 +683,21 @@ def create_spec_index(
     output_path: Path,
     version: str,
     upstream_info: dict[str, str] | None = None,
+    now: datetime | None = None,
 ) -> None:
-    """Create an index file listing all available specifications."""
+    """Create an index file listing all available specifications.
+
+    Args:
+        merged_specs: Merged specs keyed by domain.
+        output_path: Path for the index file.
+        version: Version string for the index.
+        upstream_info: Optional upstream info from get_upstream_info().
+        now: Run timestamp shared with the other outputs; defaults to the current UTC time.
+    """
+    now = now or datetime.now(tz=timezone.utc)
     index: dict[str, Any] = {
         "version": version,
-        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        "timestamp": now.isoformat(),
         "specifications": [],
     }
 
@@ -498,45 +761,44 @@ def create_spec_index(
 
         index["specifications"].append(spec_entry)
 
-    with output_path.open("w") as f:
-        json.dump(index, f, indent=2)
-        f.write("\n")
+    save_spec(index, output_path)
 
     console.print(f"[green]Created spec index at {output_path}[/green]")
 
 
-def get_upstream_info() -> dict[str, str]:
+def get_upstream_info(now: datetime | None = None) -> dict[str, str]:
     """Get upstream source information from manifest.json.
 
+    Args:
+        now: Run timestamp used for fallback values; defaults to the current UTC time.
+
     Returns dict with:
         - upstream_timestamp: YYYYMMDDHHmm format
         - upstream_etag: ETag from source
         - enriched_version: Semantic version from .version file
         - full_version: upstream_timestamp-enriched_version
     """
-    enriched_version = get_enriched_version()
+    now = now or datetime.now(tz=timezone.utc)
+    enriched_version = get_enriched_version(now)
 
     # Read manifest for upstream info
     manifest_path = Path("specs/original/manifest.json")
-    if manifest_path.exists():
-        try:
-            manifest = json.loads(manifest_path.read_text())
-            upstream_ts = manifest.get("timestamp", "")
-            etag = manifest.get("etag", "unknown")
-
-            # Convert ISO timestamp to YYYYMMDDHHmm format
-            if upstream_ts:
-                # Handle both 'Z' suffix and explicit timezone
-                ts = upstream_ts.replace("Z", "+00:00")
-                dt = datetime.fromisoformat(ts)
-                upstream_timestamp = dt.strftime("%Y%m%d%H%M")
-            else:
-                upstream_timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d%H%M")
-        except (json.JSONDecodeError, ValueError):
-            upstream_timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d%H%M")
-            etag = "unknown"
-    else:
-        upstream_timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d%H%M")
+    try:
+        manifest = json.loads(manifest_path.read_bytes())
+        upstream_ts = manifest.get("timestamp", "")
+        etag = manifest.get("etag", "unknown")
+
+        # Convert ISO timestamp to YYYYMMDDHHmm format
+        if upstream_ts:
+            # Handle both 'Z' suffix and explicit timezone
+            ts = upstream_ts.replace("Z", "+00:00")
+            dt = datetime.fromisoformat(ts)
+            upstream_timestamp = dt.strftime("%Y%m%d%H%M")
+        else:
+            upstream_timestamp = now.strftime("%Y%m%d%H%M")
+    except (FileNotFoundError, json.JSONDecodeError, ValueError):
+        # Missing or malformed manifest
+        upstream_timestamp = now.strftime("%Y%m%d%H%M")
         etag = "unknown"
 
     return {
@@ -547,12 +809,13 @@ def get_upstream_info() -> dict[str, str]:
     }
 
 
-def get_enriched_version() -> str:
+def get_enriched_version(now: datetime | None = None) -> str:
     """Get enriched version from .version file or generate date-based version."""
     version_file = Path(".version")
-    if version_file.exists():
+    try:
         return version_file.read_text().strip()
-    return datetime.now(tz=timezone.utc).strftime("%Y.%m.%d")
+    except FileNotFoundError:
+        return (now or datetime.now(tz=timezone.utc)).strftime("%Y.%m.%d")
 
 
 def get_version() -> str:
@@ -593,11 +856,25 @@ def main() -> int:
         action="store_true",
         help="Skip creating master combined specification",
     )
+    parser.add_argument(
+        "--no-parallel",
+        action="store_true",
+        help="Disable parallel processing",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of parallel workers",
+    )
 
     args = parser.parse_args()
 
+    # One timestamp for the whole run so every output agrees
+    run_time = datetime.now(tz=timezone.utc)
+
     # Get upstream info and version
-    upstream_info = get_upstream_info()
+    upstream_info = get_upstream_info(run_time)
     version = args.version or upstream_info["full_version"]
 
     console.print("[bold blue]F5 XC API Specification Merge[/bold blue]")
@@ -620,6 +897,8 @@ def main() -> int:
         args.output_dir,
         version,
         upstream_info,
+        parallel=not args.no_parallel,
+        workers=args.workers,
     )
 
     if not merged_specs:
@@ -633,7 +912,7 @@ def main() -> int:
 
     # Create index file
     index_path = args.output_dir / "index.json"
-    create_spec_index(merged_specs, index_path, version, upstream_info)
+    create_spec_index(merged_specs, index_path, version, upstream_info, now=run_time)
 
     console.print("\n[bold green]Successfully merged specifications![/bold green]")
     console.print(f"  Domains: {len(merged_specs)}")
@@ -11,6 +11,26 @@ from typing import Optional
 
 import yaml
 
+# Matches a backslash escape of a single non-alphanumeric character (e.g. "\\.")
+_ESCAPED_CHAR = re.compile(r"\\([^0-9A-Za-z])")
+
+
+def _literal_text(pattern: str) -> str | None:
+    r"""Return the plain text a pattern matches if it is a pure literal.
+
+    Patterns such as "nginx" or "views\.origin_pool" only ever match one
+    fixed string and can be tested with the str "in" operator instead of
+    the regex engine. Returns None for patterns using real regex syntax.
+
+    Args:
+        pattern: Regex pattern from the domain configuration
+
+    Returns:
+        Literal text matched by the pattern, or None if it is not a literal
+    """
+    text = _ESCAPED_CHAR.sub(r"\1", pattern)
+    return text if re.escape(text) == pattern else None
+
 
 class DomainCategorizer:
     """Utility class for categorizing API specs by domain.
@@ -21,7 +41,7 @@ class DomainCategorizer:
 
     _instance: Optional["DomainCategorizer"] = None
     _patterns: dict[str, list[str]] | None = None
-    _compiled_patterns: list[tuple[str, list[re.Pattern[str]]]] | None = None
+    _compiled_patterns: list[tuple[str, tuple[str, ...], re.Pattern[str] | None]] | None = None
 
     def __new__(cls) -> "DomainCategorizer":
         """Implement singleton pattern for shared instance."""
@@ -50,13 +70,28 @@ class DomainCategorizer:
             if isinstance(domain_config, dict) and "patterns" in domain_config:
                 patterns = domain_config["patterns"]
                 self._patterns[domain] = patterns
-                # Compile patterns at load time for performance
+                # Split each domain's patterns at load time: literals are checked with
+                # substring containment, the rest share one compiled alternation
                 try:
-                    compiled = [re.compile(p) for p in patterns]
-                    self._compiled_patterns.append((domain, compiled))
+                    for p in patterns:
+                        re.compile(p)
                 except re.error as e:
                     msg = f"Invalid regex pattern in domain '{domain}': {e}"
                     raise ValueError(msg) from e
+                literals = []
+                regex_patterns = []
+                for p in patterns:
+                    literal = _literal_text(p)
+                    if literal is None:
+                        regex_patterns.append(p)
+                    else:
+                        literals.append(literal)
+                combined = (
+                    re.compile("|".join(f"(?:{p})" for p in regex_patterns))
+                    if regex_patterns
+                    else None
+                )
+                self._compiled_patterns.append((domain, tuple(literals), combined))
             else:
                 raise ValueError(f"Invalid domain configuration for '{domain}'")
 
@@ -77,10 +112,12 @@ class DomainCategorizer:
 
         filename_lower = filename.lower()
 
-        for domain, compiled_patterns in self._compiled_patterns:
-            for pattern in compiled_patterns:
-                if pattern.search(filename_lower):
+        for domain, literals, domain_regex in self._compiled_patterns:
+            for literal in literals:
+                if literal in filename_lower:
                     return domain
+            if domain_regex is not None and domain_regex.search(filename_lower):
+                return domain
 
         return "other"
 
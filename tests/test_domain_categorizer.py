@@ -11,6 +11,7 @@ import pytest
 from scripts.utils.domain_categorizer import (
     DOMAIN_PATTERNS,
     DomainCategorizer,
+    _literal_text,
     categorize_spec,
     get_domain_patterns,
 )
@@ -265,6 +266,7 @@ class TestFallbackBehavior:
         """Verify that categorization is case-insensitive."""
         assert categorize_spec("VES.IO.SCHEMA.VIEWS.AWS_VPC_SITE.JSON") == "site_management"
         assert categorize_spec("Ves.Io.Schema.Views.App_Firewall.Json") == "waf"
+        assert categorize_spec("VES.IO.SCHEMA.VIEWS.ORIGIN_POOL.JSON") == "virtual"
 
 
 class TestBackwardCompatibility:
@@ -384,3 +386,49 @@ class TestPatternValidation:
         # service_mesh comes first, so it matches there
         result = categorize_spec("ves.io.schema.views.virtual_host.ves.json")
         assert result in ["service_mesh", "virtual"]
+
+
+class TestMatcherEquivalence:
+    """Test that optimized matching preserves first-pattern-wins semantics."""
+
+    SAMPLE_FILENAMES = (
+        "ves.io.schema.views.aws_vpc_site.json",
+        "ves.io.schema.views.http_loadbalancer.json",
+        "ves.io.schema.views.healthcheck.ves.json",
+        "ves.io.schema.views.dns_lb_healthcheck.ves.json",
+        "ves.io.schema.route.ves.json",
+        "ves.io.schema.views.virtual_host.ves.json",
+        "ves.io.schema.views.cdn_loadbalancer.json",
+        "ves.io.schema.views.operate.setup.json",
+        "ves.io.schema.views.was.user.json",
+        "ves.io.schema.views.terraform_parameters.json",
+        "ves.io.schema.gia.json",
+        "ves.io.schema.ui.static_component.json",
+        "API_SEC.API_CRAWLER.JSON",
+        "shape.recognize.json",
+        "billing.plan.json",
+        "foo.route.ves.json",
+        "ves.io.schema.views.test_service_1.json",
+    )
+
+    @staticmethod
+    def _reference_categorize(filename: str) -> str:
+        """Categorize by searching each pattern individually in declaration order."""
+        filename_lower = filename.lower()
+        for domain, patterns in DOMAIN_PATTERNS.items():
+            for pattern in patterns:
+                if re.search(pattern, filename_lower):
+                    return domain
+        return "other"
+
+    def test_literal_text_detection(self) -> None:
+        """Verify escaped literals are recognized and real regexes are not."""
+        assert _literal_text("nginx") == "nginx"
+        assert _literal_text(r"views\.origin_pool") == "views.origin_pool"
+        assert _literal_text(r"(?<!dns_lb)\.healthcheck\.ves") is None
+        assert _literal_text(r"^[^.]*\.route\.ves") is None
+
+    def test_matches_reference_implementation(self) -> None:
+        """Verify categorization matches a naive per-pattern scan."""
+        for filename in self.SAMPLE_FILENAMES:
+            assert categorize_spec(filename) == self._reference_categorize(filename), filename
@@ -0,0 +1,441 @@
+"""Unit tests for the domain spec merge script.
+
+Tests loading, merging and output of per-domain OpenAPI specifications
+produced by scripts/merge_specs.py.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts import merge_specs
+from scripts.merge_specs import (
+    MergeStats,
+    _dedupe_tags,
+    _load_spec_file,
+    _merge_single_spec,
+    create_base_spec,
+    extract_tags,
+    get_upstream_info,
+    load_spec,
+    merge_components,
+    merge_paths,
+    merge_specs_by_domain,
+    save_spec,
+)
+
+
+def _write_spec(path: Path, spec: Any) -> Path:
+    """Write a spec fixture to disk as JSON."""
+    path.write_text(json.dumps(spec))
+    return path
+
+
+@pytest.fixture
+def sample_spec() -> dict[str, Any]:
+    """Create a minimal OpenAPI spec with paths, components and tags."""
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Sample"},
+        "tags": [{"name": "Explicit", "description": "Explicit tag"}],
+        "paths": {
+            "/api/config/namespaces/{namespace}/http_loadbalancers": {
+                "get": {"tags": ["HTTP Load Balancer"]},
+                "post": {"tags": ["HTTP Load Balancer"]},
+            },
+        },
+        "components": {
+            "schemas": {"http_loadbalancerSpec": {"type": "object"}},
+            "requestBodies": {"CreateRequest": {"description": "create"}},
+        },
+    }
+
+
+class TestLoadSpecFile:
+    """Test sentinel-returning spec loading."""
+
+    def test_valid_spec(self, tmp_path: Path, sample_spec: dict[str, Any]) -> None:
+        """Verify a valid spec is returned with an empty error."""
+        spec, error = _load_spec_file(_write_spec(tmp_path / "a.json", sample_spec))
+        assert spec == sample_spec
+        assert error == ""
+
+    def test_invalid_json(self, tmp_path: Path) -> None:
+        """Verify malformed JSON returns None and an error message."""
+        path = tmp_path / "broken.json"
+        path.write_text("{not json")
+        spec, error = _load_spec_file(path)
+        assert spec is None
+        assert error
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Verify a missing file returns None instead of raising."""
+        spec, error = _load_spec_file(tmp_path / "missing.json")
+        assert spec is None
+        assert error
+
+    def test_non_object_root(self, tmp_path: Path) -> None:
+        """Verify a JSON array root is rejected."""
+        spec, error = _load_spec_file(_write_spec(tmp_path / "list.json", [1, 2]))
+        assert spec is None
+        assert "object" in error
+
+    @pytest.mark.parametrize(
+        ("bad_spec", "message"),
+        [
+            ({"components": {"schemas": []}}, "components.schemas"),
+            ({"paths": {"/x": []}}, "path item"),
+            ({"tags": ["name"]}, "tag"),
+            ({"tags": None}, "tags"),
+            ({"tags": 5}, "tags"),
+        ],
+    )
+    def test_malformed_nested_structure(
+        self,
+        tmp_path: Path,
+        bad_spec: dict[str, Any],
+        message: str,
+    ) -> None:
+        """Verify nested shapes that merging relies on are checked up front."""
+        spec, error = _load_spec_file(_write_spec(tmp_path / "bad.json", bad_spec))
+        assert spec is None
+        assert message in error
+
+    def test_non_object_paths(self, tmp_path: Path) -> None:
+        """Verify specs with malformed paths are rejected before merging."""
+        spec, error = _load_spec_file(_write_spec(tmp_path / "p.json", {"paths": []}))
+        assert spec is None
+        assert "paths" in error
+
+
+class TestMergeSingleSpec:
+    """Test merging a pre-loaded spec into a domain spec."""
+
+    def test_merge_counts(self, sample_spec: dict[str, Any]) -> None:
+        """Verify paths, components and tags are reported."""
+        merged: dict[str, Any] = {}
+        paths_added, comp_stats, tags = _merge_single_spec(sample_spec, merged, domain="virtual")
+        assert paths_added == 1
+        assert comp_stats.schemas == 1
+        assert comp_stats.request_bodies == 1
+        assert [t["name"] for t in tags] == ["Explicit", "HTTP Load Balancer"]
+        assert "http_loadbalancerSpec" in merged["components"]["schemas"]
+
+
+class TestCreateBaseSpec:
+    """Test base spec construction."""
+
+    def test_specs_are_independent(self) -> None:
+        """Verify base specs built from the shared helper do not share mutable state."""
+        first = create_base_spec("A", "first", "1.0.0")
+        second = create_base_spec("B", "second", "1.0.0")
+        first["paths"]["/x"] = {}
+        first["servers"][0]["variables"]["extra"] = {}
+        assert second["paths"] == {}
+        assert "extra" not in second["servers"][0]["variables"]
+        assert second["info"]["title"] == "B"
+
+
+class TestMergeSpecsByDomain:
+    """Test end-to-end domain merging."""
+
+    def test_broken_file_is_skipped(
+        self,
+        tmp_path: Path,
+        sample_spec: dict[str, Any],
+    ) -> None:
+        """Verify a broken file is reported and the remaining specs still merge."""
+        input_dir = tmp_path / "in"
+        input_dir.mkdir()
+        _write_spec(input_dir / "ves.io.schema.views.http_loadbalancer.json", sample_spec)
+        (input_dir / "ves.io.schema.views.origin_pool.json").write_text("{not json")
+        output_dir = tmp_path / "out"
+
+        merged_specs = merge_specs_by_domain(input_dir, output_dir, "1.0.0")
+
+        assert list(merged_specs) == ["virtual"]
+        assert (output_dir / "virtual.json").exists()
+        virtual = json.loads((output_dir / "virtual.json").read_text())
+        assert list(virtual["paths"]) == list(sample_spec["paths"])
+        assert [t["name"] for t in virtual["tags"]] == ["Explicit", "HTTP Load Balancer"]
+
+    @pytest.mark.parametrize(
+        "bad_spec",
+        [
+            {"paths": {}, "components": {"schemas": []}},
+            {"paths": {}, "tags": ["not-an-object"]},
+            {"paths": {"/api/config/x": ["not-an-object"]}},
+            {"paths": {"/api/config/x": {"get": {"tags": 5}}}},
+            {"paths": {}, "tags": None},
+            {"paths": {}, "tags": 5},
+        ],
+        ids=[
+            "schemas-list",
+            "tag-string",
+            "path-item-list",
+            "operation-tags-int",
+            "tags-null",
+            "tags-int",
+        ],
+    )
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_malformed_spec_is_skipped(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        sample_spec: dict[str, Any],
+        bad_spec: dict[str, Any],
+        parallel: bool,
+    ) -> None:
+        """Verify a spec with malformed nested structure is reported, not fatal."""
+        input_dir = tmp_path / "in"
+        input_dir.mkdir()
+        _write_spec(input_dir / "ves.io.schema.views.http_loadbalancer.json", sample_spec)
+        _write_spec(input_dir / "ves.io.schema.views.origin_pool.json", bad_spec)
+        output_dir = tmp_path / "out"
+
+        merged_specs = merge_specs_by_domain(input_dir, output_dir, "1.0.0", parallel=parallel)
+
+        assert "Failed to merge" in capsys.readouterr().out
+        assert list(merged_specs) == ["virtual"]
+        virtual = json.loads((output_dir / "virtual.json").read_text())
+        assert "http_loadbalancerSpec" in virtual["components"]["schemas"]
+        assert [t["name"] for t in virtual["tags"]] == ["Explicit", "HTTP Load Balancer"]
+
+    def test_parallel_matches_sequential(
+        self,
+        tmp_path: Path,
+        sample_spec: dict[str, Any],
+    ) -> None:
+        """Verify worker processes produce the same specs in the same domain order."""
+        input_dir = tmp_path / "in"
+        input_dir.mkdir()
+        _write_spec(input_dir / "ves.io.schema.views.http_loadbalancer.json", sample_spec)
+        _write_spec(input_dir / "ves.io.schema.dns_zone.json", sample_spec)
+        _write_spec(input_dir / "ves.io.schema.namespace.json", sample_spec)
+
+        sequential = merge_specs_by_domain(input_dir, tmp_path / "seq", "1.0.0", parallel=False)
+        parallel = merge_specs_by_domain(input_dir, tmp_path / "par", "1.0.0", workers=2)
+
+        assert list(parallel) == sorted(parallel)
+        assert parallel == sequential
+        for domain in sequential:
+            seq_text = (tmp_path / "seq" / f"{domain}.json").read_text()
+            assert (tmp_path / "par" / f"{domain}.json").read_text() == seq_text
+
+    def test_empty_directory(self, tmp_path: Path) -> None:
+        """Verify an empty input directory yields no merged specs."""
+        assert merge_specs_by_domain(tmp_path, tmp_path / "out", "1.0.0") == {}
+
+
+class TestMergeComponents:
+    """Test component merging and conflict resolution."""
+
+    def test_first_definition_wins(self) -> None:
+        """Verify existing components are never overwritten."""
+        target = {"components": {"schemas": {"A": {"v": 1}}}}
+        source = {"components": {"schemas": {"A": {"v": 2}, "B": {"v": 3}}}}
+        stats = merge_components(target, source)
+        assert stats.schemas == 1
+        assert target["components"]["schemas"] == {"A": {"v": 1}, "B": {"v": 3}}
+
+    def test_empty_target_bulk_copy(self) -> None:
+        """Verify an empty target receives every component in source order."""
+        target: dict[str, Any] = {}
+        source = {"components": {"responses": {"R2": {}, "R1": {}}}}
+        stats = merge_components(target, source)
+        assert stats == MergeStats(schemas=0, responses=2, parameters=0, request_bodies=0)
+        assert list(target["components"]["responses"]) == ["R2", "R1"]
+
+    def test_prefix_applied(self) -> None:
+        """Verify prefixed merges rename components."""
+        target: dict[str, Any] = {}
+        source = {"components": {"parameters": {"P": {"in": "query"}}}}
+        merge_components(target, source, prefix="dns_")
+        assert list(target["components"]["parameters"]) == ["dns_P"]
+
+    def test_prefixed_collisions_keep_source_order(self) -> None:
+        """Verify prefixed names that already exist are skipped without reordering."""
+        target = {"components": {"schemas": {"dns_B": {"v": 0}}}}
+        source = {"components": {"schemas": {"C": {}, "B": {"v": 1}, "A": {}}}}
+        stats = merge_components(target, source, prefix="dns_")
+        assert stats.schemas == 2
+        assert list(target["components"]["schemas"]) == ["dns_B", "dns_C", "dns_A"]
+        assert target["components"]["schemas"]["dns_B"] == {"v": 0}
+
+
+class TestMergePaths:
+    """Test path merging and domain filtering."""
+
+    def test_disjoint_paths_added(self) -> None:
+        """Verify new paths are all added in source order."""
+        target = {"paths": {"/a": {"get": {}}}}
+        source = {"paths": {"/c": {"get": {}}, "/b": {"post": {}}}}
+        assert merge_paths(target, source) == 2
+        assert list(target["paths"]) == ["/a", "/c", "/b"]
+
+    def test_overlapping_path_merges_methods(self) -> None:
+        """Verify methods are merged into an existing path and counted."""
+        target = {"paths": {"/a": {"get": {"v": 1}}}}
+        source = {"paths": {"/a": {"get": {"v": 2}, "put": {}}, "/b": {"get": {}}}}
+        assert merge_paths(target, source) == 2
+        assert target["paths"]["/a"] == {"get": {"v": 1}, "put": {}}
+        assert list(target["paths"]) == ["/a", "/b"]
+
+    def test_foreign_domain_paths_filtered(self) -> None:
+        """Verify CDN paths only merge into the CDN domain."""
+        source = {"paths": {"/api/cdn/x": {"get": {}}, "/api/config/y": {"get": {}}}}
+        target: dict[str, Any] = {}
+        assert merge_paths(target, source, domain="virtual") == 1
+        assert list(target["paths"]) == ["/api/config/y"]
+
+        cdn_target: dict[str, Any] = {}
+        assert merge_paths(cdn_target, source, domain="cdn_and_content_delivery") == 2
+
+
+class TestExtractTags:
+    """Test tag extraction from a single spec."""
+
+    def test_explicit_tags_take_precedence(self) -> None:
+        """Verify explicit tag objects win over names found on operations."""
+        spec = {
+            "tags": [{"name": "B", "description": "explicit"}, {"description": "unnamed"}],
+            "paths": {"/x": {"get": {"tags": ["A", "B"]}, "parameters": []}},
+        }
+        tags = extract_tags(spec)
+        assert tags == [{"name": "B", "description": "explicit"}, {"name": "A"}]
+
+    def test_duplicate_explicit_tags(self) -> None:
+        """Verify the first explicit definition of a tag is kept."""
+        spec = {"tags": [{"name": "A", "description": "1"}, {"name": "A", "description": "2"}]}
+        assert extract_tags(spec) == [{"name": "A", "description": "1"}]
+
+
+class TestDedupeTags:
+    """Test tag deduplication across merged specs."""
+
+    def test_first_definition_wins_and_sorted(self) -> None:
+        """Verify the first tag per name is kept, unnamed tags dropped, output sorted."""
+        tags = [
+            {"name": "b", "description": "first"},
+            {"name": "a"},
+            {"description": "unnamed"},
+            {"name": "b", "description": "second"},
+        ]
+        assert _dedupe_tags(tags) == [{"name": "a"}, {"name": "b", "description": "first"}]
+
+
+class TestSaveAndLoadSpec:
+    """Test JSON serialization of specs with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+    ) -> None:
+        """Verify both code paths write identical indented UTF-8 output."""
+        if use_orjson and not merge_specs.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(merge_specs, "ORJSON_AVAILABLE", use_orjson)
+        spec = {"info": {"title": "Café — API"}, "paths": {}, "tags": [{"name": "a"}]}
+        output_path = tmp_path / "nested" / "spec.json"
+
+        save_spec(spec, output_path)
+
+        text = output_path.read_text(encoding="utf-8")
+        assert text == json.dumps(spec, indent=2, ensure_ascii=False) + "\n"
+        assert load_spec(output_path) == spec
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "1.5e-07",
+            "1e+16",
+            "1e-05",
+            "[\n    2.5e-05,\n    0.5\n  ]",
+            "NaN",
+            "-Infinity",
+            "18446744073709551616",
+            "-9223372036854775809",
+        ],
+    )
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip_preserves_number_formatting(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+        value: str,
+    ) -> None:
+        """Verify floats, non-finite values and big integers survive unchanged."""
+        if use_orjson and not merge_specs.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(merge_specs, "ORJSON_AVAILABLE", use_orjson)
+        text = f'{{\n  "minimum": {value}\n}}\n'
+        input_path = tmp_path / "input.json"
+        input_path.write_text(text, encoding="utf-8")
+        output_path = tmp_path / "output.json"
+
+        save_spec(load_spec(input_path), output_path)
+
+        assert output_path.read_text(encoding="utf-8") == text
+
+    def test_unchanged_file_not_rewritten(self, tmp_path: Path) -> None:
+        """Verify identical content keeps the existing file and its mtime."""
+        spec = {"info": {"title": "A"}, "paths": {}}
+        output_path = tmp_path / "spec.json"
+        save_spec(spec, output_path)
+        os.utime(output_path, ns=(1_000_000_000, 1_000_000_000))
+
+        save_spec(spec, output_path)
+        assert output_path.stat().st_mtime_ns == 1_000_000_000
+
+        spec["info"]["title"] = "B"
+        save_spec(spec, output_path)
+        assert output_path.stat().st_mtime_ns != 1_000_000_000
+        assert load_spec(output_path) == spec
+
+
+class TestGetUpstreamInfo:
+    """Test version information derived from the run timestamp."""
+
+    def test_fallbacks_use_run_timestamp(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Verify fallback timestamp and version come from the supplied time."""
+        monkeypatch.chdir(tmp_path)
+        now = datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc)
+
+        info = get_upstream_info(now)
+
+        assert info["upstream_timestamp"] == "202601020304"
+        assert info["enriched_version"] == "2026.01.02"
+        assert info["full_version"] == "202601020304-2026.01.02"
+
+    def test_manifest_and_version_file(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Verify manifest timestamp, ETag and .version are used when present."""
+        monkeypatch.chdir(tmp_path)
+        manifest_dir = tmp_path / "specs" / "original"
+        manifest_dir.mkdir(parents=True)
+        (manifest_dir / "manifest.json").write_text(
+            json.dumps({"timestamp": "2025-12-20T08:13:00Z", "etag": '"abc"'}),
+        )
+        (tmp_path / ".version").write_text("1.0.12\n")
+
+        info = get_upstream_info()
+
+        assert info["upstream_timestamp"] == "202512200813"
+        assert info["upstream_etag"] == '"abc"'
+        assert info["full_version"] == "202512200813-1.0.12"